@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""Build the optional fastscan test accelerator.
+
+The actor system itself is pure Python; this only exists so
+`python setup.py build_ext --inplace` can produce the fastscan extension
+the test suite picks up when present. package_dir points the in-place
+build at src/ so the .so lands next to conftest.py, which is the only
+directory `make test` (pytest src/) puts on sys.path.
+"""
+
+from setuptools import Extension, setup
+
+setup(
+    package_dir={"": "src"},
+    ext_modules=[Extension("fastscan", ["src/fastscan.c"])],
+)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Shared pytest helpers for the actor system tests."""
+
+from collections import Counter
+import contextlib
+import io
+import os
+import re
+
+import main
+
+try:
+    from fastscan import count_many
+except ImportError:  # pragma: no cover - optional accelerator
+    count_many = None
+
+# All the examples finish well under a second, so a tight deadline makes a
+# deadlocked run fail fast instead of hanging for the old 10 s per example.
+# Override with ACTOR_TEST_TIMEOUT on slow machines.
+FAST_TIMEOUT = float(os.environ.get("ACTOR_TEST_TIMEOUT", "2"))
+
+
+def run_actor_system(script, timeout=FAST_TIMEOUT):
+    """Run main.main once and return everything it printed, as bytes.
+
+    Capturing through redirect_stdout (rather than capsys, which is
+    function-scoped) lets the result be cached in module-scoped fixtures,
+    so each test file boots the actor system once instead of once per
+    test. The worker and signal-processor threads all print through
+    sys.stdout and are joined before main() returns, so the buffer holds
+    the complete run.
+
+    Returning the raw UTF-8 bytes skips a full decode pass and keeps the
+    needle probes on bytes.count / b"..." in, which dispatch to the C
+    memmem fast path instead of the generic unicode search.
+    """
+    raw = io.BytesIO()
+    wrapper = io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+    with contextlib.redirect_stdout(wrapper):
+        main.main(["main.py", script], timeout=timeout)
+    wrapper.flush()
+    return raw.getvalue()
+
+
+def count_needles(output, needles):
+    """Tally how often each needle occurs in output.
+
+    All needles are counted in one compiled-regex pass over the output
+    (SRE walks the buffer once) instead of one full bytes.count scan per
+    needle. Alternatives are sorted longest-first so a needle that
+    extends another wins at a shared start, and since finditer matches
+    are non-overlapping, occurrences of a needle inside a longer matched
+    needle are restored from a containment map afterwards. Needles
+    absent from the output count as 0.
+
+    Caveat for the regex path: the containment map only restores
+    needles that occur entirely inside another needle. Two needles that
+    overlap partially without one containing the other (b"ab" and b"ba"
+    over b"aba") undercount the later alternative relative to
+    output.count, because finditer consumes the overlapped bytes. None
+    of the current NEEDLES sets can collide this way, but keep it in
+    mind when adding needles.
+
+    When the fastscan extension is built (python setup.py build_ext
+    --inplace), the whole tally is one C call running glibc's SIMD
+    memmem per needle instead of the regex pass; that path reports
+    exact per-needle output.count totals with no overlap caveat.
+    """
+    needles = tuple(dict.fromkeys(needles))
+
+    if count_many is not None:
+        return Counter(dict(zip(needles, count_many(output, needles))))
+
+    pattern = re.compile(
+        b"|".join(re.escape(n) for n in sorted(needles, key=len, reverse=True))
+    )
+    raw = Counter(m.group() for m in pattern.finditer(output))
+
+    counts = Counter({needle: raw[needle] for needle in needles})
+    for long, hits in raw.items():
+        if not hits:
+            continue
+        for short in needles:
+            if short != long and short in long:
+                counts[short] += long.count(short) * hits
+    return counts
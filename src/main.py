@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 
+import atexit
+from collections import deque
 from concurrent import interpreters
 import datetime
+import hashlib
+import importlib.util
+import marshal
 import os
-import json
 import signal
 import sys
-import time
+import tempfile
 import threading
-from queue import Queue
+from queue import Empty, Queue
 import uuid
 
 
@@ -17,148 +21,329 @@ def timestamp():
     return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
 
 
+# Maximum number of signals drained per signal_processor wakeup
+SIGNAL_BATCH_SIZE = 256
+
+# Cache of marshalled code objects by script path, so each distinct script
+# is read and compiled once per process instead of once per actor
+_script_code_cache: "dict[str, bytes]" = {}
+
+# Digest prefix length of the on-disk .pyac cache files
+_SCRIPT_DIGEST_SIZE = 16
+
+# Validated header of a .pyac file: the interpreter's bytecode magic
+# number, then a digest of the source. marshal output is version-specific,
+# so without the magic a Python upgrade would keep loading stale bytecode
+# (the source digest still matches) until the cache files were deleted by
+# hand - the same reason .pyc headers carry it.
+_SCRIPT_CACHE_HEADER_SIZE = len(importlib.util.MAGIC_NUMBER) + _SCRIPT_DIGEST_SIZE
+
+
+def compile_script(script_path):
+    """Return the marshalled code object for an actor script, caching by path.
+
+    The bytes are shareable via prepare_main(), so the subinterpreter only
+    pays a marshal.loads() instead of file I/O plus compile().
+
+    Compiles are also cached on disk next to the script, pycache-style, so
+    repeat runs (each test invocation re-imports nothing but re-parses
+    everything) skip the compile entirely. The cache file holds a
+    bytecode magic number and a blake2b digest of the source, followed by
+    the marshalled code; a stale digest (script changed) or magic number
+    (interpreter changed) means the cache is rewritten. Cache
+    writes go through a temp file and os.replace so a concurrent run
+    never sees a half-written file, and any OSError just falls back to
+    compiling.
+    """
+    code_bytes = _script_code_cache.get(script_path)
+    if code_bytes is not None:
+        return code_bytes
+
+    with open(script_path, "rb") as f:
+        source = f.read()
+    digest = hashlib.blake2b(source, digest_size=_SCRIPT_DIGEST_SIZE).digest()
+    header = importlib.util.MAGIC_NUMBER + digest
+
+    cache_path = script_path + "c"  # foo.pya -> foo.pyac
+    try:
+        with open(cache_path, "rb") as f:
+            cached = f.read()
+        if cached[:_SCRIPT_CACHE_HEADER_SIZE] == header:
+            code_bytes = cached[_SCRIPT_CACHE_HEADER_SIZE:]
+    except OSError:
+        pass
+
+    if code_bytes is None:
+        code_bytes = marshal.dumps(compile(source, script_path, "exec"))
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(cache_path) or ".", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(header + code_bytes)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    _script_code_cache[script_path] = code_bytes
+    return code_bytes
+
 # Global interpreter pool for reuse across multiple runs (e.g., between tests)
 _global_interp_pool: "Queue[interpreters.Interpreter]" = Queue()
 
-# Pre-populate the pool with one interpreter per core
-# Pre-import asyncio to warm up each interpreter
+# Everything the bootstrap and its helpers import, plus the persistent
+# event loop, so pooled interpreters skip first-import cost on spawn
+_PREWARM_SRC = """
+import asyncio
+import builtins
+import collections
+import io
+import marshal
+import os
+
+_actor_loop = asyncio.new_event_loop()
+asyncio.set_event_loop(_actor_loop)
+"""
+
+# Keep at least this many warm interpreters around. A spawn burst larger
+# than the core count (a tree of actors fanning out) would otherwise pay a
+# full bootstrap - imports included - per extra actor, serialized inside
+# the signal processor.
 _num_cores = os.cpu_count() or 1
-for _ in range(_num_cores):
+_INTERP_POOL_FLOOR = max(_num_cores, 8)
+
+# Pre-populate the pool up to the floor. Paying the bootstrap here, at
+# import, keeps it out of every subsequent spawn (and out of every timed
+# test run).
+for _ in range(_INTERP_POOL_FLOOR):
     interp = interpreters.create()
-    interp.exec("import asyncio")
+    interp.exec(_PREWARM_SRC)
     _global_interp_pool.put(interp)
 
+_pool_refill_needed = threading.Event()
+_pool_closing = False
 
-class Actor:
-    """An actor with its own subinterpreter, mailbox, and state."""
 
-    def __init__(self, script_path, actor_id, run_id, from_subinterps_queue, interp=None):
-        self.id = actor_id
-        self.run_id = run_id
-        self.script_path = script_path
-        self.from_subinterps_queue = from_subinterps_queue
-        self.mailbox_queue = interpreters.create_queue()
-        self.status_queue = interpreters.create_queue()
-        self.interp = interp if interp is not None else interpreters.create()
-        self.state = "ready"
+def _replenish_interp_pool():
+    """Warm fresh interpreters in the background up to _INTERP_POOL_FLOOR.
 
-        self._bootstrap()
+    Runs in a daemon thread so the ~300 ms import bootstrap happens off the
+    signal-processor thread; _handle_spawn only ever pays it when a burst
+    outruns both the pool and this thread.
+    """
+    while not _pool_closing:
+        _pool_refill_needed.wait()
+        _pool_refill_needed.clear()
+        while not _pool_closing and _global_interp_pool.qsize() < _INTERP_POOL_FLOOR:
+            interp = interpreters.create()
+            interp.exec(_PREWARM_SRC)
+            # Re-check before the put: the atexit drain may have started
+            # while this interpreter was prewarming (a late put would
+            # outlive the drain and trip CPython's shutdown warning), and
+            # recycled interpreters returned meanwhile may already have
+            # refilled the pool past the floor
+            if _pool_closing or _global_interp_pool.qsize() >= _INTERP_POOL_FLOOR:
+                interp.close()
+            else:
+                _global_interp_pool.put(interp)
+
+
+_interp_pool_refill_thread = threading.Thread(
+    target=_replenish_interp_pool, daemon=True, name="interp-pool-refill"
+)
+_interp_pool_refill_thread.start()
+_pool_refill_needed.set()
+
+
+@atexit.register
+def _drain_interp_pool():
+    """Close pooled interpreters at exit so CPython doesn't warn about them."""
+    global _pool_closing
+    _pool_closing = True
+    _pool_refill_needed.set()
+    # Wait out any prewarm in flight; otherwise its put() lands in the
+    # already-drained pool and the interpreter leaks past the drain
+    _interp_pool_refill_thread.join()
+    while True:
+        try:
+            interp = _global_interp_pool.get_nowait()
+        except Empty:
+            return
+        try:
+            interp.close()
+        except Exception:
+            pass
 
-    def _bootstrap(self):
-        """Initialize the subinterpreter with crank_one_tick and actor runtime."""
-        self.interp.prepare_main(
-            from_subinterps_queue=self.from_subinterps_queue,
-            mailbox_queue=self.mailbox_queue,
-            status_queue=self.status_queue
-        )
 
-        bootstrap_code = f"""
-# Queue objects are already bound via prepare_main()
-# from_subinterps_queue, mailbox_queue, status_queue are available
+# Source executed in each actor's subinterpreter. A static string compiled
+# once per exec; all per-actor values (ACTOR_ID, SCRIPT_PATH, the queues and
+# user_code_bytes) are bound as globals via prepare_main() beforehand.
+BOOTSTRAP_SRC = '''
+# Per-actor values are already bound via prepare_main():
+# ACTOR_ID, SCRIPT_PATH, from_subinterps_queue, status_queue,
+# user_code_bytes
 import asyncio
-from concurrent import interpreters
-import json
-import uuid
+import builtins
+import collections
+import io
+import marshal
+import os
 
+# Hoisted lookups for the hot helpers below - module-global loads are
+# cheaper than an attribute lookup (or an import) per call
+_builtin_print = builtins.print
+_StringIO = io.StringIO
 
-ACTOR_ID = {self.id}
-SCRIPT_PATH = "{self.script_path}"
 
 # Actor state
 pending_future = None
 user_task = None
-loop = None
-spawn_requests = {{}}  # request_id → cast function
+spawn_requests = {}  # request_id → cast function
+_spawn_seq = 0  # per-actor counter for generating request IDs
+
+# How many ticks recv() yields and re-probes the mailbox before sending a
+# BLOCKED signal; absorbs messages already in flight without paying the
+# main-interpreter wakeup roundtrip
+_RECV_RETRIES = 3
+
+# Local mailbox: the main interpreter batches pending messages into
+# inbox_bytes (via prepare_main) before each tick; crank_one_tick
+# unmarshals them here
+mailbox = collections.deque()
+inbox_bytes = b""
+
+# One event loop per interpreter, reused across every actor this
+# interpreter hosts - _cleanup() preserves it so recycled interpreters
+# skip loop construction (selector, self-pipe, signal wakeup fd)
+if "_actor_loop" not in globals():
+    _actor_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_actor_loop)
+loop = _actor_loop
+
+# Unmarshalled code objects per script path, kept across actor reuse like
+# the event loop, so a recycled interpreter re-running the same script
+# skips the marshal.loads
+if "_script_codes" not in globals():
+    _script_codes = {}
 
 
 def spawn(script_path):
-    \"\"\"Spawn a new actor and return a cast function for it.\"\"\"
-    import os
-    request_id = str(uuid.uuid4())
+    """Spawn a new actor and return a cast function for it."""
+    global _spawn_seq
+
+    # Actor IDs are unique per run, so (actor_id, sequence) packed into a
+    # single int is collision-free and far cheaper to generate and hash
+    # than a uuid4 hex string
+    _spawn_seq += 1
+    request_id = (ACTOR_ID << 32) | _spawn_seq
 
     # Resolve script path relative to current script's directory
     if not os.path.isabs(script_path):
         script_dir = os.path.dirname(os.path.abspath(SCRIPT_PATH))
         script_path = os.path.join(script_dir, script_path)
 
-    signal = f"{{ACTOR_ID}}:SPAWN:{{request_id}}:{{script_path}}"
-    from_subinterps_queue.put(signal)
+    from_subinterps_queue.put(("SPAWN", ACTOR_ID, request_id, script_path))
 
     def make_cast(rid):
         def cast(message):
-            json_msg = json.dumps(message)
-            signal = f"{{ACTOR_ID}}:CAST:{{rid}}:{{json_msg}}"
-            from_subinterps_queue.put(signal)
+            # The queue copies the message on put(), which is all the
+            # isolation guarantee requires - no need to serialize to JSON
+            # first and deserialize on the other side.
+            from_subinterps_queue.put(("CAST", ACTOR_ID, rid, message))
         return cast
 
     return make_cast(request_id)
 
 async def recv():
-    \"\"\"Receive a message from this actor's mailbox.\"\"\"
+    """Receive a message from this actor's mailbox."""
     global pending_future
 
     # Try immediate delivery
-    try:
-        obj = mailbox_queue.get_nowait()
-        return json.loads(obj)
-    except interpreters.QueueEmpty:
-        pass
+    if mailbox:
+        return mailbox.popleft()
+
+    # Yield control and re-probe: a message delivered between ticks is
+    # picked up here without the Future + BLOCKED-signal roundtrip through
+    # the main interpreter's scheduler
+    for _ in range(_RECV_RETRIES):
+        await asyncio.sleep(0)
+        if mailbox:
+            return mailbox.popleft()
 
     pending_future = asyncio.Future()
-    signal = f"{{ACTOR_ID}}:BLOCKED"
-    from_subinterps_queue.put(signal)
+    from_subinterps_queue.put(("BLOCKED", ACTOR_ID))
     return await pending_future
 
 def print(*args, **kwargs):
-    \"\"\"Print with actor ID prefix by sending signal to main.\"\"\"
-    import io
-    import builtins
-    import json
-
-    output = io.StringIO()
-    builtins.print(f"[Actor {{ACTOR_ID}}]", *args, **kwargs, file=output)
+    """Print with actor ID prefix by sending signal to main."""
+    output = _StringIO()
+    _builtin_print(f"[Actor {ACTOR_ID}]", *args, **kwargs, file=output)
     formatted_output = output.getvalue().rstrip('\\n')
 
-    signal = f"{{ACTOR_ID}}:PRINT:{{json.dumps(formatted_output)}}"
-    from_subinterps_queue.put(signal)
+    from_subinterps_queue.put(("PRINT", ACTOR_ID, formatted_output))
+
+def _cleanup():
+    """Reset the global namespace so this interpreter can host a new actor.
+
+    Deletes only names user code added since bootstrap; the bootstrap's own
+    names (helpers, the persistent loop) survive and are simply redefined
+    by the next bootstrap exec.
+    """
+    g = globals()
+    for name in [n for n in g if n not in _INITIAL_GLOBALS]:
+        try:
+            del g[name]
+        except Exception:
+            pass
 
 def crank_one_tick():
-    \"\"\"Execute one iteration of the actor's event loop.
+    """Execute one iteration of the actor's event loop.
 
     Returns:
         "ready" - Actor made progress, reschedule
         "blocked" - Actor waiting for message
         "done" - Actor completed
-    \"\"\"
-    global pending_future, user_task, loop
+    """
+    global pending_future, user_task, inbox_bytes
 
-    if user_task is None:
-        with open(SCRIPT_PATH) as f:
-            user_code = f.read()
+    # Pull in whatever the main interpreter delivered since the last tick
+    if inbox_bytes:
+        mailbox.extend(marshal.loads(inbox_bytes))
+        inbox_bytes = b""
 
-        namespace = {{}}
-        exec(user_code, namespace)
+    if user_task is None:
+        code = _script_codes.get(SCRIPT_PATH)
+        if code is None:
+            code = marshal.loads(user_code_bytes)
+            _script_codes[SCRIPT_PATH] = code
+
+        # Each actor still gets a fresh namespace; only the code object
+        # (immutable) is shared between actors running the same script
+        namespace = {}
+        exec(code, namespace)
         user_main = namespace.get('main')
 
         if user_main is None:
             status_queue.put("done")
             return
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         user_task = loop.create_task(user_main(recv, spawn, print))
 
     # Check if we can fulfill a pending recv
     if pending_future and not pending_future.done():
-        try:
-            obj = mailbox_queue.get_nowait()
-            msg = json.loads(obj)
-            pending_future.set_result(msg)
+        if mailbox:
+            pending_future.set_result(mailbox.popleft())
             pending_future = None
-        except interpreters.QueueEmpty:
+        else:
             status_queue.put("blocked")
             return
 
+    # If no callbacks are ready and no timers are scheduled, running the
+    # loop cannot make progress - skip the selector poll entirely
+    if not user_task.done() and not loop._ready and not loop._scheduled:
+        status_queue.put("blocked")
+        return
+
     # Drain event loop - process everything ready
     loop.run_until_complete(asyncio.sleep(0))
 
@@ -168,16 +353,92 @@ def crank_one_tick():
         status_queue.put("blocked")
     else:
         status_queue.put("ready")
-"""
 
-        self.interp.exec(bootstrap_code)
+# Snapshot taken once all bootstrap names exist; reused by every _cleanup()
+# call on this interpreter. Stable across recycles: cleanup removes the
+# user names, re-bootstrap redefines the same bootstrap names.
+_INITIAL_GLOBALS = frozenset(globals()) | {"_INITIAL_GLOBALS"}
+'''
+
+
+class WorkQueue:
+    """Unbounded FIFO of runnable actors.
+
+    A deque under a Condition - the same structure queue.SimpleQueue uses -
+    which skips queue.Queue's maxsize check and task-done bookkeeping on
+    every put/get.
+    """
+
+    def __init__(self):
+        self._items = deque()
+        self._cond = threading.Condition()
+
+    def put(self, item):
+        with self._cond:
+            self._items.append(item)
+            self._cond.notify()
+
+    def get(self):
+        with self._cond:
+            while not self._items:
+                self._cond.wait()
+            return self._items.popleft()
+
+
+class Actor:
+    """An actor with its own subinterpreter, mailbox, and state."""
+
+    __slots__ = ("id", "run_id", "script_path", "from_subinterps_queue",
+                 "mailbox", "status_queue", "interp", "state", "sched_lock")
+
+    def __init__(self, script_path, actor_id, run_id, from_subinterps_queue, interp=None):
+        self.id = actor_id
+        self.run_id = run_id
+        self.script_path = script_path
+        self.from_subinterps_queue = from_subinterps_queue
+        # Mailbox lives in the main interpreter; pending messages are
+        # marshalled into the subinterpreter in one batch per tick instead
+        # of trickling through a polling cross-interpreter queue
+        self.mailbox = deque()
+        # Serializes the blocked/ready transition between the worker that
+        # just ran this actor and a CAST delivering to it; without it a
+        # message landing between the worker's mailbox probe and its state
+        # write is never woken up
+        self.sched_lock = threading.Lock()
+        self.status_queue = interpreters.create_queue()
+        self.interp = interp if interp is not None else interpreters.create()
+        self.state = "ready"
+
+        self._bootstrap()
+
+    def _bootstrap(self):
+        """Initialize the subinterpreter with crank_one_tick and actor runtime."""
+        self.interp.prepare_main(
+            ACTOR_ID=self.id,
+            SCRIPT_PATH=self.script_path,
+            from_subinterps_queue=self.from_subinterps_queue,
+            status_queue=self.status_queue,
+            user_code_bytes=compile_script(self.script_path)
+        )
+
+        self.interp.exec(BOOTSTRAP_SRC)
 
     def crank_one_tick(self):
         """Execute one tick of this actor's event loop.
 
+        Any messages queued in the main-interpreter mailbox are handed to
+        the subinterpreter first, as one marshalled batch. Messages must be
+        marshallable (plain data: str, int, dict, list, ...).
+
         Returns:
             "ready", "blocked", or "done"
         """
+        if self.mailbox:
+            inbox = []
+            while self.mailbox:
+                inbox.append(self.mailbox.popleft())
+            self.interp.prepare_main(inbox_bytes=marshal.dumps(inbox))
+
         self.interp.exec("crank_one_tick()")
 
         status = self.status_queue.get_nowait()
@@ -192,20 +453,10 @@ def crank_one_tick():
         Returns:
             The cleaned interpreter object.
         """
-        cleanup_code = """
-initial_globals = {'__builtins__', '__doc__', '__loader__', '__name__', '__package__', '__spec__'}
-current_globals = set(globals().keys())
-names_to_delete = current_globals - initial_globals
-
-# Delete each added name
-for name in names_to_delete:
-    try:
-        del globals()[name]
-    except:
-        pass
-"""
         try:
-            self.interp.exec(cleanup_code)
+            # _cleanup() is installed by the bootstrap, so teardown execs a
+            # single call instead of compiling a statement block each time
+            self.interp.exec("_cleanup()")
         except Exception as e:
             print(f"[System] Error cleaning namespace for {self}: {e}")
 
@@ -214,6 +465,8 @@ for name in names_to_delete:
     def destroy(self):
         """Destroy this actor's subinterpreter.
         """
+        if self.interp is None:
+            return
         try:
             self.interp.close()
         except Exception as e:
@@ -223,13 +476,14 @@ for name in names_to_delete:
         return f"Actor({self.id}, {self.script_path})"
 
 
-def worker(work_queue, worker_id, all_actors, interp_pool, spawn_requests, from_subinterps_queue, next_actor_id):
+def worker(work_queue, worker_id, all_actors, alive_actors, interp_pool, spawn_requests, from_subinterps_queue, next_actor_id):
     """Worker thread that executes actors from the work queue.
 
     Args:
         work_queue: Queue of actors ready to run
         worker_id: ID of this worker thread
         all_actors: Dict of all actors by ID
+        alive_actors: Set of IDs of actors that are not yet dead
         interp_pool: Queue of available interpreters for reuse
         spawn_requests: Dict mapping request_id → actor_id
         from_subinterps_queue: Queue for receiving signals from subinterpreters
@@ -249,6 +503,7 @@ def worker(work_queue, worker_id, all_actors, interp_pool, spawn_requests, from_
         except Exception as e:
             print(f"[{timestamp()}] [Worker {worker_id}] ERROR in {actor}: {e}")
             actor.state = "dead"
+            alive_actors.discard(actor.id)
             # On error, destroy the interpreter (don't return to pool)
             actor.destroy()
             continue
@@ -257,115 +512,202 @@ def worker(work_queue, worker_id, all_actors, interp_pool, spawn_requests, from_
             actor.state = "ready"
             work_queue.put(actor)
         elif status == "blocked":
-            # Check if messages arrived while we were running (level-triggered check)
-            try:
-                obj = actor.mailbox_queue.get_nowait()
-                actor.mailbox_queue.put(obj)
-                actor.state = "ready"
-                work_queue.put(actor)
-            except interpreters.QueueEmpty:
-                actor.state = "blocked"
+            # Check if messages arrived while we were running (level-triggered
+            # check). Under sched_lock so a concurrent CAST either lands
+            # before the probe (rescheduled here) or after the state write
+            # (sees "blocked" and reschedules itself) - never in between.
+            with actor.sched_lock:
+                if actor.mailbox:
+                    actor.state = "ready"
+                    work_queue.put(actor)
+                else:
+                    actor.state = "blocked"
         elif status == "done":
             print(f"[{timestamp()}] [Worker {worker_id}] {actor} finished")
             actor.state = "dead"
+            alive_actors.discard(actor.id)
 
 
-def process_one_signal(subsignal, all_actors, work_queue, spawn_requests, pending_messages, from_subinterps_queue, next_actor_id, interp_pool):
-    """Process a single signal from a subinterpreter.
+class SignalContext:
+    """Shared scheduler state handed to the signal handlers.
 
-    Returns:
-        (should_continue, dead_actor_id)
-        - should_continue: False if SHUTDOWN, True otherwise
-        - dead_actor_id: None if signal was from alive actor, actor_id if from dead actor (for cleanup)
+    Bundles the structures that worker threads, the signal processor, and
+    main() all share, so handlers take (subsignal, actor, ctx) instead of
+    a long positional argument list.
     """
-    if subsignal == "SHUTDOWN":
-        return (False, None)
 
-    parts = subsignal.split(":", 2)
-    actor_id_str, action = parts[0], parts[1]
-    actor_id = int(actor_id_str)
-    payload = parts[2] if len(parts) > 2 else ""
+    __slots__ = ("all_actors", "alive_actors", "work_queue", "spawn_requests",
+                 "pending_messages", "from_subinterps_queue", "next_actor_id",
+                 "interp_pool", "print_sink")
+
+    def __init__(self, all_actors, alive_actors, work_queue, spawn_requests,
+                 pending_messages, from_subinterps_queue, next_actor_id, interp_pool):
+        self.all_actors = all_actors
+        self.alive_actors = alive_actors
+        self.work_queue = work_queue
+        self.spawn_requests = spawn_requests
+        self.pending_messages = pending_messages
+        self.from_subinterps_queue = from_subinterps_queue
+        self.next_actor_id = next_actor_id
+        self.interp_pool = interp_pool
+        # When set to a list, PRINT output is collected there so the caller
+        # can flush a whole batch with one stdout write
+        self.print_sink = None
+
+
+def _handle_print(subsignal, actor, ctx):
+    """Handle ("PRINT", actor_id, text)."""
+    print_output = subsignal[2]
+    if ctx.print_sink is not None:
+        ctx.print_sink.append(print_output)
+    else:
+        print(print_output)
+
 
-    actor = all_actors.get(actor_id)
-    is_dead = actor and actor.state == "dead"
+def _handle_blocked(subsignal, actor, ctx):
+    """Handle ("BLOCKED", actor_id).
 
-    if action == "PRINT":
-        print_output = json.loads(payload) if payload else ""
-        print(print_output)
+    Scheduling state is owned by the worker (via the tick status) and the
+    CAST path; flipping the state here could mark an actor that is already
+    rescheduled and sitting in the work queue as "blocked", letting a later
+    CAST enqueue it a second time. The signal itself still serves as the
+    subinterpreter's wakeup request for the tick in flight.
+    """
 
-    elif action == "BLOCKED":
-        if actor and actor.state != "dead":
-            actor.state = "blocked"
 
-    elif action == "SPAWN":
-        payload_parts = payload.split(":", 1)
-        request_id, script_path = payload_parts[0], payload_parts[1]
+def _handle_spawn(subsignal, actor, ctx):
+    """Handle ("SPAWN", actor_id, request_id, script_path)."""
+    actor_id, request_id, script_path = subsignal[1], subsignal[2], subsignal[3]
 
-        print(f"[{timestamp()}] [System] Processing SPAWN from actor {actor_id}: {script_path}")
-        print(f"[{timestamp()}] [System] SPAWN request_id: {request_id[:8]}...")
+    print(f"[{timestamp()}] [System] Processing SPAWN from actor {actor_id}: {script_path}")
+    print(f"[{timestamp()}] [System] SPAWN request_id: {request_id}")
 
-        parent_actor = all_actors.get(actor_id)
-        if not parent_actor:
-            print(f"[{timestamp()}] [System] ERROR: Parent actor {actor_id} not found")
-            return (True, None)
+    if not actor:
+        print(f"[{timestamp()}] [System] ERROR: Parent actor {actor_id} not found")
+        return
 
-        new_actor_id = next_actor_id[0]
-        next_actor_id[0] += 1
+    # Read and compile the script before taking an interpreter: this is
+    # the step that does file I/O and compiles user code, so a bad spawn
+    # (missing script, syntax error) must fail just this spawn request,
+    # not the signal-processor thread. The result is cached, so the Actor
+    # constructor's own compile_script call below is a dict hit.
+    try:
+        compile_script(script_path)
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"[{timestamp()}] [System] ERROR: Cannot spawn {script_path}: {e}")
+        return
 
-        try:
-            interp = interp_pool.get_nowait()
-            print(f"[{timestamp()}] [System] Reusing interpreter from pool for actor {new_actor_id}")
-            new_actor = Actor(script_path, new_actor_id, parent_actor.run_id, from_subinterps_queue, interp)
-        except Exception:
-            new_actor = Actor(script_path, new_actor_id, parent_actor.run_id, from_subinterps_queue)
+    new_actor_id = ctx.next_actor_id[0]
+    ctx.next_actor_id[0] += 1
 
-        all_actors[new_actor.id] = new_actor
-        work_queue.put(new_actor)
+    try:
+        interp = ctx.interp_pool.get_nowait()
+        print(f"[{timestamp()}] [System] Reusing interpreter from pool for actor {new_actor_id}")
+    except Empty:
+        interp = None
 
-        spawn_requests[request_id] = new_actor.id
-        print(f"[{timestamp()}] [System] Registered request_id {request_id[:8]}... → actor {new_actor.id}")
+    try:
+        if interp is not None:
+            new_actor = Actor(script_path, new_actor_id, actor.run_id, ctx.from_subinterps_queue, interp)
+        else:
+            new_actor = Actor(script_path, new_actor_id, actor.run_id, ctx.from_subinterps_queue)
+    except Exception as e:
+        # Bootstrap may have left the interpreter in an unknown state, so
+        # close it rather than return it to the pool
+        print(f"[{timestamp()}] [System] ERROR: Failed to spawn {script_path}: {e}")
+        if interp is not None:
+            try:
+                interp.close()
+            except Exception:
+                pass
+        return
 
-        if request_id in pending_messages:
-            messages = pending_messages.pop(request_id)
-            print(f"[{timestamp()}] [System] Delivering {len(messages)} pending messages to actor {new_actor.id}")
-            for json_msg in messages:
-                new_actor.mailbox_queue.put(json_msg)
+    # Nudge the background replenisher so the next burst finds warm
+    # interpreters instead of bootstrapping here
+    _pool_refill_needed.set()
 
-        print(f"[{timestamp()}] [System] Spawned {new_actor} (parent was actor {actor_id})")
+    ctx.all_actors[new_actor.id] = new_actor
+    ctx.alive_actors.add(new_actor.id)
+    ctx.work_queue.put(new_actor)
 
-    elif action == "CAST":
-        payload_parts = payload.split(":", 1)
-        request_id, json_msg = payload_parts[0], payload_parts[1]
+    ctx.spawn_requests[request_id] = new_actor.id
+    print(f"[{timestamp()}] [System] Registered request_id {request_id} → actor {new_actor.id}")
 
-        print(f"[{timestamp()}] [System] CAST from actor {actor_id} with request_id: {request_id[:8]}...")
+    if request_id in ctx.pending_messages:
+        messages = ctx.pending_messages.pop(request_id)
+        print(f"[{timestamp()}] [System] Delivering {len(messages)} pending messages to actor {new_actor.id}")
+        new_actor.mailbox.extend(messages)
 
-        target_id = spawn_requests.get(request_id)
-        if target_id is None:
-            print(f"[{timestamp()}] [System] Actor not yet created for request_id {request_id[:8]}..., queueing message")
-            if request_id not in pending_messages:
-                pending_messages[request_id] = []
-            pending_messages[request_id].append(json_msg)
-            return (True, None)
+    print(f"[{timestamp()}] [System] Spawned {new_actor} (parent was actor {actor_id})")
 
-        target = all_actors.get(target_id)
-        if target is None:
-            print(f"[{timestamp()}] [System] ERROR: Actor {target_id} not found")
-            return (True, None)
 
-        target.mailbox_queue.put(json_msg)
+def _handle_cast(subsignal, actor, ctx):
+    """Handle ("CAST", actor_id, request_id, message)."""
+    actor_id, request_id, message = subsignal[1], subsignal[2], subsignal[3]
 
+    print(f"[{timestamp()}] [System] CAST from actor {actor_id} with request_id: {request_id}")
+
+    target_id = ctx.spawn_requests.get(request_id)
+    if target_id is None:
+        print(f"[{timestamp()}] [System] Actor not yet created for request_id {request_id}, queueing message")
+        if request_id not in ctx.pending_messages:
+            ctx.pending_messages[request_id] = []
+        ctx.pending_messages[request_id].append(message)
+        return
+
+    target = ctx.all_actors.get(target_id)
+    if target is None:
+        print(f"[{timestamp()}] [System] ERROR: Actor {target_id} not found")
+        return
+
+    target.mailbox.append(message)
+
+    with target.sched_lock:
         if target.state == "blocked":
             target.state = "ready"
-            work_queue.put(target)
+            ctx.work_queue.put(target)
         elif target.state == "ready" or target.state == "running":
+            # Already queued or mid-tick; the worker's level-triggered
+            # mailbox check after the tick picks the message up
             pass
         elif target.state == "dead":
             print(f"[{timestamp()}] [System] WARNING: Message delivered to dead actor {target_id}")
 
+
+_SIGNAL_HANDLERS = {
+    "PRINT": _handle_print,
+    "BLOCKED": _handle_blocked,
+    "SPAWN": _handle_spawn,
+    "CAST": _handle_cast,
+}
+
+
+def process_one_signal(subsignal, ctx):
+    """Process a single signal from a subinterpreter.
+
+    Unpacks the signal tuple and dispatches through _SIGNAL_HANDLERS - one
+    tuple index, one dict lookup, one call per signal.
+
+    Returns:
+        (should_continue, dead_actor_id)
+        - should_continue: False if SHUTDOWN, True otherwise
+        - dead_actor_id: None if signal was from alive actor, actor_id if from dead actor (for cleanup)
+    """
+    if subsignal == "SHUTDOWN":
+        return (False, None)
+
+    actor_id = subsignal[1]
+    actor = ctx.all_actors.get(actor_id)
+    is_dead = actor and actor.state == "dead"
+
+    handler = _SIGNAL_HANDLERS.get(subsignal[0])
+    if handler is not None:
+        handler(subsignal, actor, ctx)
+
     return (True, actor_id if is_dead else None)
 
 
-def signal_processor(all_actors, work_queue, spawn_requests, pending_messages, from_subinterps_queue, next_actor_id, interp_pool):
+def signal_processor(all_actors, alive_actors, work_queue, spawn_requests, pending_messages, from_subinterps_queue, next_actor_id, interp_pool, system_idle, processor_busy):
     """Process signals from subinterpreters.
 
     Args:
@@ -376,41 +718,94 @@ def signal_processor(all_actors, work_queue, spawn_requests, pending_messages, f
         from_subinterps_queue: Queue for receiving signals from subinterpreters
         next_actor_id: List with one element [next_id] for tracking actor IDs
         interp_pool: Queue of available interpreters for reuse
+        system_idle: Event set when no actors remain and the queue is quiet
+        processor_busy: Event held set except during observed-quiet
+            periods, so main() never mistakes signals in flight (drained
+            from the queue but not yet handled) for a finished system
     """
+    ctx = SignalContext(all_actors, alive_actors, work_queue, spawn_requests,
+                        pending_messages, from_subinterps_queue, next_actor_id, interp_pool)
     dead_actors_pending_cleanup = set()
 
+    def run_deferred_cleanup():
+        print(f"[{timestamp()}] [System] Processing deferred cleanup for {len(dead_actors_pending_cleanup)} actors")
+        for actor_id in dead_actors_pending_cleanup:
+            actor = all_actors.get(actor_id)
+            if actor:
+                try:
+                    interp = actor.cleanup_namespace()
+                    interp_pool.put(interp)
+                    # The pool owns the interpreter now; clearing the
+                    # reference keeps main()'s final destroy pass from
+                    # closing an interpreter that later runs will reuse
+                    actor.interp = None
+                    print(f"[{timestamp()}] [System] Cleaned up {actor} and returned to pool")
+                except Exception as e:
+                    print(f"[{timestamp()}] [System] Error cleaning {actor} for reuse: {e}")
+                    actor.destroy()
+        dead_actors_pending_cleanup.clear()
+
     while True:
+        # Raise busy before touching the queue so a signal is never
+        # invisible to main(): from here until the quiet branch below it
+        # is either still in the queue (qsize sees it) or in our hands
+        # (processor_busy sees it).
+        processor_busy.set()
+
         try:
-            subsignal = from_subinterps_queue.get_nowait()
-        except interpreters.QueueEmpty:
+            # Block in the queue instead of spinning with get_nowait() +
+            # sleep; the timeout doubles as the deferred-cleanup interval.
+            subsignal = from_subinterps_queue.get(timeout=0.01)
+        except (interpreters.QueueEmpty, TimeoutError):
             if dead_actors_pending_cleanup:
-                print(f"[{timestamp()}] [System] Processing deferred cleanup for {len(dead_actors_pending_cleanup)} actors")
-                for actor_id in dead_actors_pending_cleanup:
-                    actor = all_actors.get(actor_id)
-                    if actor:
-                        try:
-                            interp = actor.cleanup_namespace()
-                            interp_pool.put(interp)
-                            print(f"[{timestamp()}] [System] Cleaned up {actor} and returned to pool")
-                        except Exception as e:
-                            print(f"[{timestamp()}] [System] Error cleaning {actor} for reuse: {e}")
-                            actor.destroy()
-                dead_actors_pending_cleanup.clear()
-
-            time.sleep(0.000001)
+                run_deferred_cleanup()
+
+            # A timed-out get means the queue was empty for the whole wait;
+            # if no actors remain either, let main() wake up and finish
+            # shutdown. Re-probe the queue after observing alive_actors
+            # empty: an actor's dying SPAWN is enqueued before its death is
+            # marked, so any spawn still in flight is visible here.
+            if not alive_actors and from_subinterps_queue.qsize() == 0:
+                processor_busy.clear()
+                system_idle.set()
+
             continue
 
-        should_continue, dead_actor_id = process_one_signal(
-            subsignal, all_actors, work_queue, spawn_requests, pending_messages,
-            from_subinterps_queue, next_actor_id, interp_pool
-        )
+        # Drain whatever else is already queued so many signals share one
+        # cross-interpreter wakeup instead of paying a roundtrip each.
+        batch = [subsignal]
+        try:
+            while len(batch) < SIGNAL_BATCH_SIZE:
+                batch.append(from_subinterps_queue.get_nowait())
+        except interpreters.QueueEmpty:
+            pass
+
+        print_lines = []
+        ctx.print_sink = print_lines
+        should_continue = True
+        for subsignal in batch:
+            should_continue, dead_actor_id = process_one_signal(subsignal, ctx)
+
+            if not should_continue:
+                break
+
+            if dead_actor_id is not None:
+                dead_actors_pending_cleanup.add(dead_actor_id)
+
+        ctx.print_sink = None
+        if print_lines:
+            sys.stdout.write("\n".join(print_lines) + "\n")
+
+        # Recycle dead actors' interpreters between batches as well as on
+        # quiet periods: under sustained signal traffic the quiet-period
+        # path may never run, starving the pool and forcing every SPAWN to
+        # pay a fresh interpreter bootstrap (imports included)
+        if dead_actors_pending_cleanup:
+            run_deferred_cleanup()
 
         if not should_continue:
             break
 
-        if dead_actor_id is not None:
-            dead_actors_pending_cleanup.add(dead_actor_id)
-
 
 def main(argv=None, timeout=None):
     """Run the actor system with the specified script.
@@ -427,7 +822,8 @@ def main(argv=None, timeout=None):
             raise TimeoutError(f"Execution exceeded {timeout} seconds timeout")
 
         signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout)
+        # setitimer rather than alarm so sub-second timeouts work
+        signal.setitimer(signal.ITIMER_REAL, timeout)
 
     if len(argv) < 2:
         print("Usage: python main.py <actor_script.pya>")
@@ -455,16 +851,21 @@ def main(argv=None, timeout=None):
 
     # Create work queue and actor tracking
     # Use global interpreter pool for reuse across test runs
-    work_queue = Queue()
+    work_queue = WorkQueue()
     all_actors = {}
+    alive_actors = set()  # IDs of actors not yet dead, for O(1) liveness checks
+    system_idle = threading.Event()  # Signaled when the system may be finished
+    processor_busy = threading.Event()  # Held set while a signal batch is mid-flight
     spawn_requests = {}  # request_id → actor_id
     pending_messages = {}  # request_id → list of messages that arrived before actor was created
 
     # Start signal processor thread
     signal_thread = threading.Thread(
         target=signal_processor,
-        args=(all_actors, work_queue, spawn_requests, pending_messages, from_subinterps_queue, next_actor_id, _global_interp_pool),
-        daemon=False
+        args=(all_actors, alive_actors, work_queue, spawn_requests, pending_messages, from_subinterps_queue, next_actor_id, _global_interp_pool, system_idle, processor_busy),
+        # Daemon so a run aborted by the watchdog timeout cannot wedge
+        # interpreter shutdown behind a thread blocked on its queue
+        daemon=True
     )
     signal_thread.start()
 
@@ -473,8 +874,8 @@ def main(argv=None, timeout=None):
     for i in range(num_workers):
         t = threading.Thread(
             target=worker,
-            args=(work_queue, i, all_actors, _global_interp_pool, spawn_requests, from_subinterps_queue, next_actor_id),
-            daemon=False
+            args=(work_queue, i, all_actors, alive_actors, _global_interp_pool, spawn_requests, from_subinterps_queue, next_actor_id),
+            daemon=True
         )
         t.start()
         threads.append(t)
@@ -483,55 +884,42 @@ def main(argv=None, timeout=None):
     print(f"[{timestamp()}] [System] Spawning initial parent actor: {actor_script}\n")
     root_actor_id = next_actor_id[0]
     next_actor_id[0] += 1
-    root_actor = Actor(actor_script, root_actor_id, run_id, from_subinterps_queue)
+    try:
+        # Prefer a pre-warmed interpreter: a fresh one pays the asyncio
+        # import inside the bootstrap
+        interp = _global_interp_pool.get_nowait()
+        root_actor = Actor(actor_script, root_actor_id, run_id, from_subinterps_queue, interp)
+    except Exception:
+        root_actor = Actor(actor_script, root_actor_id, run_id, from_subinterps_queue)
     all_actors[root_actor.id] = root_actor
+    alive_actors.add(root_actor.id)
     work_queue.put(root_actor)
 
-    # Wait for all actors to finish
+    # Wait for all actors to finish. Only the signal processor sets
+    # system_idle - after a quiet period with its batch fully processed -
+    # because a signal drained into a batch but not yet handled is invisible
+    # to both alive_actors and the queue; re-check both on each wakeup.
     print(f"[{timestamp()}] [System] Waiting for all actors to complete...")
-    iterations = 0
     while True:
-        time.sleep(0.001)  # Check every 1ms - CRITICAL: yield to other threads
-        iterations += 1
+        signaled = system_idle.wait(timeout=2.0)
+        system_idle.clear()
 
-        # Check if all actors are dead AND signal queue is empty (no pending spawns)
-        all_dead = all(actor.state == "dead" for actor in all_actors.values())
-        try:
-            subsignal = from_subinterps_queue.get_nowait()
-            # There's a signal in the queue - put it back and keep waiting
-            from_subinterps_queue.put(subsignal)
-            queue_empty = False
-        except interpreters.QueueEmpty:
-            queue_empty = True
+        # All actors dead AND signal queue empty (no pending spawns) means
+        # done. qsize() probes without dequeuing - stealing a signal here
+        # would race the signal processor and reorder its delivery.
+        all_dead = not alive_actors
+        queue_empty = from_subinterps_queue.qsize() == 0
 
-        if all_dead and queue_empty:
+        if all_dead and queue_empty and not processor_busy.is_set():
             break
 
-        # Debug: print non-dead actors every 200 iterations (2 seconds)
-        if iterations % 200 == 0:
+        # Debug: report non-dead actors when the wait times out
+        if not signaled:
             non_dead = [(actor.id, actor.state) for actor in all_actors.values() if actor.state != "dead"]
             print(f"[{timestamp()}] [System] Still waiting... Non-dead actors: {non_dead}, queue_empty: {queue_empty}")
 
     print(f"[{timestamp()}] [System] All actors completed!")
 
-    # Drain any remaining signals from the queue before shutdown
-    print(f"[{timestamp()}] [System] Draining signal queue...")
-
-    # Process any remaining signals
-    while True:
-        try:
-            subsignal = from_subinterps_queue.get_nowait()
-            # Process remaining PRINT signals
-            if ":" in subsignal:
-                parts = subsignal.split(":", 2)
-                if len(parts) >= 2:
-                    action = parts[1]
-                    if action == "PRINT" and len(parts) > 2:
-                        print_output = json.loads(parts[2]) if parts[2] else ""
-                        print(print_output)
-        except interpreters.QueueEmpty:
-            break
-
     # Shutdown
     print(f"[{timestamp()}] [System] Shutting down threads...")
 
@@ -539,6 +927,19 @@ def main(argv=None, timeout=None):
     from_subinterps_queue.put("SHUTDOWN")
     signal_thread.join()
 
+    # Drain anything that slipped in behind the SHUTDOWN sentinel - only
+    # after the signal processor has stopped, so the drain cannot race it
+    # and reorder output
+    print(f"[{timestamp()}] [System] Draining signal queue...")
+    while True:
+        try:
+            subsignal = from_subinterps_queue.get_nowait()
+            # Process remaining PRINT signals (CAST signals to dead actors are dropped)
+            if isinstance(subsignal, tuple) and subsignal[0] == "PRINT":
+                print(subsignal[2])
+        except interpreters.QueueEmpty:
+            break
+
     # Stop workers
     for _ in range(num_workers):
         work_queue.put(None)
@@ -552,13 +953,13 @@ def main(argv=None, timeout=None):
     # Now clean up all actors (destroy subinterpreters and queues)
     print(f"[{timestamp()}] [System] Cleaning up actors...")
     for actor in all_actors.values():
-        actor.destroy()
+        actor.destroy()  # no-op for actors whose interpreter was pooled
 
     print(f"[{timestamp()}] [System] Cleanup complete!")
 
-    # Cancel alarm if it was set
+    # Cancel the timer if it was set
     if timeout is not None:
-        signal.alarm(0)
+        signal.setitimer(signal.ITIMER_REAL, 0)
 
 
 if __name__ == "__main__":
@@ -2,89 +2,110 @@
 """Test chain actor communication (root -> branch -> leaf)."""
 
 import pytest
-import main
 
-
-def test_chain_three_actors(capsys):
+from conftest import count_needles, run_actor_system
+
+# Every phrase the tests below look for; counted in one pass over the output
+NEEDLES = (
+    b"ROOT starting",
+    b"ROOT spawning 1 branch...",
+    b"ROOT sending message to branch...",
+    b"ROOT finished",
+    b"BRANCH started",
+    b"BRANCH started, waiting for message...",
+    b"BRANCH received: hello from root",
+    b"BRANCH spawning 1 leaf...",
+    b"BRANCH sending message to leaf...",
+    b"BRANCH finished",
+    b"LEAF started",
+    b"LEAF started, waiting for message...",
+    b"LEAF received: hello from branch (got: hello from root)",
+    b"LEAF finished",
+    b"Starting actor system",
+    b"Spawning initial parent actor: examples/chain/actor_root_chain.pya",
+    b"[System] Processing SPAWN from actor",
+    b"actor_branch_recv.pya",
+    b"parent was actor",
+    b"actor_leaf_recv.pya",
+    b"examples/chain/actor_root_chain.pya) finished",
+    b"actor_branch_recv.pya) finished",
+    b"actor_leaf_recv.pya) finished",
+    b"[System] All actors completed!",
+    b"[System] All workers completed! Total actors spawned: 3",
+    b"[System] Cleanup complete!",
+)
+
+
+@pytest.fixture(scope="module")
+def chain_output():
+    """Run the chain example once and share the output across tests."""
+    return run_actor_system("examples/chain/actor_root_chain.pya")
+
+
+@pytest.fixture(scope="module")
+def counts(chain_output):
+    """Needle occurrence counts for the shared run."""
+    return count_needles(chain_output, NEEDLES)
+
+
+def test_chain_three_actors(counts):
     """Test chain of three actors: root -> branch -> leaf."""
+    assert counts[b"ROOT starting"] >= 1
+    assert counts[b"ROOT spawning 1 branch..."] >= 1
+    assert counts[b"ROOT sending message to branch..."] >= 1
+    assert counts[b"ROOT finished"] >= 1
 
-    main.main(["main.py", "examples/chain/actor_root_chain.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    output = captured.out
-
-    assert "ROOT starting" in output
-    assert "ROOT spawning 1 branch..." in output
-    assert "ROOT sending message to branch..." in output
-    assert "ROOT finished" in output
+    assert counts[b"BRANCH started, waiting for message..."] >= 1
+    assert counts[b"BRANCH received: hello from root"] >= 1
+    assert counts[b"BRANCH spawning 1 leaf..."] >= 1
+    assert counts[b"BRANCH sending message to leaf..."] >= 1
+    assert counts[b"BRANCH finished"] >= 1
 
-    assert "BRANCH started, waiting for message..." in output
-    assert "BRANCH received: hello from root" in output
-    assert "BRANCH spawning 1 leaf..." in output
-    assert "BRANCH sending message to leaf..." in output
-    assert "BRANCH finished" in output
+    assert counts[b"LEAF started, waiting for message..."] >= 1
+    assert counts[b"LEAF received: hello from branch (got: hello from root)"] >= 1
+    assert counts[b"LEAF finished"] >= 1
 
-    assert "LEAF started, waiting for message..." in output
-    assert "LEAF received: hello from branch (got: hello from root)" in output
-    assert "LEAF finished" in output
+    assert counts[b"Starting actor system"] >= 1
+    assert counts[b"Spawning initial parent actor: examples/chain/actor_root_chain.pya"] >= 1
 
-    assert "Starting actor system" in output
-    assert "Spawning initial parent actor: examples/chain/actor_root_chain.pya" in output
+    assert counts[b"[System] Processing SPAWN from actor"] >= 1
+    assert counts[b"actor_branch_recv.pya"] >= 1
+    assert counts[b"parent was actor"] >= 1
 
-    assert "[System] Processing SPAWN from actor" in output
-    assert "actor_branch_recv.pya" in output
-    assert "parent was actor" in output
+    assert counts[b"actor_leaf_recv.pya"] >= 1
 
-    assert "actor_leaf_recv.pya" in output
+    assert counts[b"examples/chain/actor_root_chain.pya) finished"] >= 1
+    assert counts[b"actor_branch_recv.pya) finished"] >= 1
+    assert counts[b"actor_leaf_recv.pya) finished"] >= 1
 
-    assert "examples/chain/actor_root_chain.pya) finished" in output
-    assert "actor_branch_recv.pya) finished" in output
-    assert "actor_leaf_recv.pya) finished" in output
+    assert counts[b"[System] All actors completed!"] >= 1
+    assert counts[b"[System] All workers completed! Total actors spawned: 3"] >= 1
+    assert counts[b"[System] Cleanup complete!"] >= 1
 
-    assert "[System] All actors completed!" in output
-    assert "[System] All workers completed! Total actors spawned: 3" in output
-    assert "[System] Cleanup complete!" in output
 
-
-def test_chain_message_passing(capsys):
+def test_chain_message_passing(counts):
     """Test that messages are correctly passed through the chain."""
+    assert counts[b"ROOT sending message to branch..."] >= 1
 
-    main.main(["main.py", "examples/chain/actor_root_chain.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    output = captured.out
-
-    assert "ROOT sending message to branch..." in output
+    assert counts[b"BRANCH received: hello from root"] >= 1
+    assert counts[b"BRANCH sending message to leaf..."] >= 1
 
-    assert "BRANCH received: hello from root" in output
-    assert "BRANCH sending message to leaf..." in output
+    assert counts[b"LEAF received: hello from branch (got: hello from root)"] >= 1
 
-    assert "LEAF received: hello from branch (got: hello from root)" in output
 
-
-def test_chain_completion(capsys):
+def test_chain_completion(counts):
     """Test that chain example completes successfully."""
-
-    main.main(["main.py", "examples/chain/actor_root_chain.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    assert "[System] Cleanup complete!" in captured.out
+    assert counts[b"[System] Cleanup complete!"] >= 1
 
 
-def test_chain_actor_count(capsys):
+def test_chain_actor_count(counts):
     """Test that exactly 3 actors are spawned in the chain."""
+    assert counts[b"[System] All workers completed! Total actors spawned: 3"] >= 1
 
-    main.main(["main.py", "examples/chain/actor_root_chain.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    output = captured.out
-
-    assert "Total actors spawned: 3" in output
-
-    assert "ROOT starting" in output
-    assert "BRANCH started" in output
-    assert "LEAF started" in output
+    assert counts[b"ROOT starting"] >= 1
+    assert counts[b"BRANCH started"] >= 1
+    assert counts[b"LEAF started"] >= 1
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -2,41 +2,61 @@
 """Test simple parent-child actor communication."""
 
 import pytest
-import main
 
+from conftest import count_needles, run_actor_system
 
-def test_simple_parent_child(capsys):
-    """Test simple parent spawns child and sends one message."""
+# Every phrase the tests below look for; counted in one pass over the output
+NEEDLES = (
+    b"Parent starting, spawning child...",
+    b"Parent sending message...",
+    b"Parent finished",
+    b"received message: hello",
+    b"Child finished",
+    b"Starting actor system",
+    b"Spawning initial parent actor",
+    b"[System] Processing SPAWN from actor",
+    b"parent was actor",
+    b"examples/simple/actor_simple_parent.pya) finished",
+    b"[System] All actors completed!",
+    b"[System] All workers completed! Total actors spawned: 2",
+    b"[System] Cleanup complete!",
+)
 
-    main.main(["main.py", "examples/simple/actor_simple_parent.pya"], timeout=10)
 
-    captured = capsys.readouterr()
-    output = captured.out
+@pytest.fixture(scope="module")
+def simple_output():
+    """Run the simple example once and share the output across tests."""
+    return run_actor_system("examples/simple/actor_simple_parent.pya")
 
-    assert "Parent starting, spawning child..." in output
-    assert "Parent sending message..." in output
-    assert "Parent finished" in output
-    assert "received message: hello" in output
-    assert "Child finished" in output
 
-    assert "Starting actor system" in output
-    assert "Spawning initial parent actor" in output
-    assert "[System] Processing SPAWN from actor" in output
-    assert "parent was actor" in output
-    assert "examples/simple/actor_simple_parent.pya) finished" in output
-    assert "[System] All actors completed!" in output
-    assert "[System] All workers completed! Total actors spawned: 2" in output
-    assert "[System] Cleanup complete!" in output
+@pytest.fixture(scope="module")
+def counts(simple_output):
+    """Needle occurrence counts for the shared run."""
+    return count_needles(simple_output, NEEDLES)
 
 
-def test_simple_completion(capsys):
+def test_simple_parent_child(counts):
+    """Test simple parent spawns child and sends one message."""
+    assert counts[b"Parent starting, spawning child..."] >= 1
+    assert counts[b"Parent sending message..."] >= 1
+    assert counts[b"Parent finished"] >= 1
+    assert counts[b"received message: hello"] >= 1
+    assert counts[b"Child finished"] >= 1
+
+    assert counts[b"Starting actor system"] >= 1
+    assert counts[b"Spawning initial parent actor"] >= 1
+    assert counts[b"[System] Processing SPAWN from actor"] >= 1
+    assert counts[b"parent was actor"] >= 1
+    assert counts[b"examples/simple/actor_simple_parent.pya) finished"] >= 1
+    assert counts[b"[System] All actors completed!"] >= 1
+    assert counts[b"[System] All workers completed! Total actors spawned: 2"] >= 1
+    assert counts[b"[System] Cleanup complete!"] >= 1
+
+
+def test_simple_completion(counts):
     """Test that simple example completes successfully."""
-
-    main.main(["main.py", "examples/simple/actor_simple_parent.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    assert "[System] Cleanup complete!" in captured.out
+    assert counts[b"[System] Cleanup complete!"] >= 1
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
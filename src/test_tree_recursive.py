@@ -2,73 +2,92 @@
 """Test recursive binary tree actor structure."""
 
 import pytest
-import main
 
-
-def test_tree_recursive_structure(capsys):
+from conftest import count_needles, run_actor_system
+
+# Every phrase the tests below look for; counted in one pass over the output
+NEEDLES = (
+    b"Starting binary tree spawn test",
+    b"Creating root actor (depth 0, max_depth 2)",
+    b"Expected actors: 1 + 2 + 4 = 7 total",
+    b"Root spawned",
+    b"Tree spawn test complete",
+    b"Spawning 2 children at depth 1",
+    b"Spawning 2 children at depth 2",
+    b"Spawned 2 children from depth",
+    b"Leaf node at depth 2 (max depth reached)",
+    b"finished",
+    b"Starting actor system",
+    b"Spawning initial parent actor: examples/tree_recursive/actor_tree_root.pya",
+    b"[System] All actors completed!",
+    b"[System] Cleanup complete!",
+    b"Total actors spawned: 8",
+    b"actor_tree.pya",
+    b"Actor started, waiting for depth message...",
+    b"Received message:",
+    b"'depth': 0",
+    b"depth: 0",
+    b"depth=0",
+    b"'max_depth': 2",
+    b"max_depth: 2",
+    b"max_depth=2",
+)
+
+
+@pytest.fixture(scope="module")
+def tree_output():
+    """Run the recursive tree example once and share the output across tests."""
+    return run_actor_system("examples/tree_recursive/actor_tree_root.pya")
+
+
+@pytest.fixture(scope="module")
+def counts(tree_output):
+    """Needle occurrence counts for the shared run."""
+    return count_needles(tree_output, NEEDLES)
+
+
+def test_tree_recursive_structure(counts):
     """Test that recursive tree creates binary tree with depth 0, 1, 2."""
+    assert counts[b"Starting binary tree spawn test"] >= 1
+    assert counts[b"Creating root actor (depth 0, max_depth 2)"] >= 1
+    assert counts[b"Expected actors: 1 + 2 + 4 = 7 total"] >= 1
+    assert counts[b"Root spawned"] >= 1
+    assert counts[b"Tree spawn test complete"] >= 1
 
-    main.main(["main.py", "examples/tree_recursive/actor_tree_root.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    output = captured.out
-
-    assert "Starting binary tree spawn test" in output
-    assert "Creating root actor (depth 0, max_depth 2)" in output
-    assert "Expected actors: 1 + 2 + 4 = 7 total" in output
-    assert "Root spawned" in output
-    assert "Tree spawn test complete" in output
+    assert counts[b"Spawning 2 children at depth 1"] >= 1  # From depth 0 actor
+    assert counts[b"Spawning 2 children at depth 2"] == 2  # From 2 depth 1 actors
+    assert counts[b"Spawned 2 children from depth"] == 3  # depth 0 and 2x depth 1
 
-    assert "Spawning 2 children at depth 1" in output  # From depth 0 actor
-    assert output.count("Spawning 2 children at depth 2") == 2  # From 2 depth 1 actors
-    assert output.count("Spawned 2 children from depth") == 3  # depth 0 and 2x depth 1
+    assert counts[b"Leaf node at depth 2 (max depth reached)"] == 4
 
-    assert output.count("Leaf node at depth 2 (max depth reached)") == 4
+    assert counts[b"finished"] >= 7  # At least 7 tree actors finish
 
-    assert output.count("finished") >= 7  # At least 7 tree actors finish
+    assert counts[b"Starting actor system"] >= 1
+    assert counts[b"Spawning initial parent actor: examples/tree_recursive/actor_tree_root.pya"] >= 1
+    assert counts[b"[System] All actors completed!"] >= 1
+    assert counts[b"[System] Cleanup complete!"] >= 1
 
-    assert "Starting actor system" in output
-    assert "Spawning initial parent actor: examples/tree_recursive/actor_tree_root.pya" in output
-    assert "[System] All actors completed!" in output
-    assert "[System] Cleanup complete!" in output
 
-
-def test_tree_recursive_actor_count(capsys):
+def test_tree_recursive_actor_count(counts):
     """Test that exactly 8 actors are spawned (1 root spawner + 7 tree actors)."""
+    assert counts[b"Total actors spawned: 8"] >= 1
 
-    main.main(["main.py", "examples/tree_recursive/actor_tree_root.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    output = captured.out
-
-    assert "Total actors spawned: 8" in output
+    assert counts[b"actor_tree.pya"] >= 7  # At least 7 tree actors spawned
 
-    assert output.count("actor_tree.pya") >= 7  # At least 7 tree actors spawned
 
-
-def test_tree_recursive_message_passing(capsys):
+def test_tree_recursive_message_passing(counts):
     """Test that depth messages are correctly passed through the tree."""
+    assert counts[b"Actor started, waiting for depth message..."] >= 1
+    assert counts[b"Received message:"] >= 1
 
-    main.main(["main.py", "examples/tree_recursive/actor_tree_root.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    output = captured.out
-
-    assert "Actor started, waiting for depth message..." in output
-    assert "Received message:" in output
+    assert counts[b"'depth': 0"] or counts[b"depth: 0"] or counts[b"depth=0"]
+    assert counts[b"'max_depth': 2"] or counts[b"max_depth: 2"] or counts[b"max_depth=2"]
 
-    assert "'depth': 0" in output or "depth: 0" in output or "depth=0" in output
-    assert "'max_depth': 2" in output or "max_depth: 2" in output or "max_depth=2" in output
 
-
-def test_tree_recursive_completion(capsys):
+def test_tree_recursive_completion(counts):
     """Test that recursive tree example completes successfully."""
-
-    main.main(["main.py", "examples/tree_recursive/actor_tree_root.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    assert "[System] Cleanup complete!" in captured.out
+    assert counts[b"[System] Cleanup complete!"] >= 1
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
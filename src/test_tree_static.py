@@ -2,74 +2,90 @@
 """Test static tree actor structure (root -> 2 branches -> 4 leaves)."""
 
 import pytest
-import main
 
-
-def test_tree_static_structure(capsys):
+from conftest import count_needles, run_actor_system
+
+# Every phrase the tests below look for; counted in one pass over the output
+NEEDLES = (
+    b"ROOT starting",
+    b"ROOT spawning 2 branches...",
+    b"ROOT finished spawning",
+    b"ROOT finished",
+    b"BRANCH started",
+    b"BRANCH spawning 2 leaves...",
+    b"BRANCH finished spawning",
+    b"LEAF started",
+    b"LEAF finished",
+    b"Starting actor system",
+    b"Spawning initial parent actor: examples/tree_static/actor_root_tree.pya",
+    b"[System] All actors completed!",
+    b"[System] All workers completed! Total actors spawned: 7",
+    b"[System] Cleanup complete!",
+    b"Total actors spawned: 7",
+    b"[System] Processing SPAWN from actor",
+    b"actor_branch.pya",
+    b"actor_leaf.pya",
+    b"actor_root_tree.pya) finished",
+    b"actor_branch.pya) finished",
+    b"actor_leaf.pya) finished",
+)
+
+
+@pytest.fixture(scope="module")
+def tree_output():
+    """Run the static tree example once and share the output across tests."""
+    return run_actor_system("examples/tree_static/actor_root_tree.pya")
+
+
+@pytest.fixture(scope="module")
+def counts(tree_output):
+    """Needle occurrence counts for the shared run."""
+    return count_needles(tree_output, NEEDLES)
+
+
+def test_tree_static_structure(counts):
     """Test that tree creates correct structure: 1 root + 2 branches + 4 leaves."""
+    assert counts[b"ROOT starting"] >= 1
+    assert counts[b"ROOT spawning 2 branches..."] >= 1
+    assert counts[b"ROOT finished spawning"] >= 1
+    assert counts[b"ROOT finished"] >= 1
 
-    main.main(["main.py", "examples/tree_static/actor_root_tree.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    output = captured.out
-
-    assert "ROOT starting" in output
-    assert "ROOT spawning 2 branches..." in output
-    assert "ROOT finished spawning" in output
-    assert "ROOT finished" in output
+    assert counts[b"BRANCH started"] == 2
+    assert counts[b"BRANCH spawning 2 leaves..."] == 2
+    assert counts[b"BRANCH finished spawning"] == 2
 
-    assert output.count("BRANCH started") == 2
-    assert output.count("BRANCH spawning 2 leaves...") == 2
-    assert output.count("BRANCH finished spawning") == 2
+    assert counts[b"LEAF started"] == 4
+    assert counts[b"LEAF finished"] == 4
 
-    assert output.count("LEAF started") == 4
-    assert output.count("LEAF finished") == 4
+    assert counts[b"Starting actor system"] >= 1
+    assert counts[b"Spawning initial parent actor: examples/tree_static/actor_root_tree.pya"] >= 1
 
-    assert "Starting actor system" in output
-    assert "Spawning initial parent actor: examples/tree_static/actor_root_tree.pya" in output
+    assert counts[b"[System] All actors completed!"] >= 1
+    assert counts[b"[System] All workers completed! Total actors spawned: 7"] >= 1
+    assert counts[b"[System] Cleanup complete!"] >= 1
 
-    assert "[System] All actors completed!" in output
-    assert "[System] All workers completed! Total actors spawned: 7" in output
-    assert "[System] Cleanup complete!" in output
 
-
-def test_tree_static_actor_count(capsys):
+def test_tree_static_actor_count(counts):
     """Test that exactly 7 actors are spawned in the tree."""
+    assert counts[b"Total actors spawned: 7"] >= 1
 
-    main.main(["main.py", "examples/tree_static/actor_root_tree.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    output = captured.out
-
-    assert "Total actors spawned: 7" in output
+    assert counts[b"[System] Processing SPAWN from actor"] >= 2
+    assert counts[b"actor_branch.pya"] >= 1
 
-    assert output.count("[System] Processing SPAWN from actor") >= 2
-    assert "actor_branch.pya" in output
+    assert counts[b"actor_leaf.pya"] >= 1
 
-    assert "actor_leaf.pya" in output
 
-
-def test_tree_static_completion(capsys):
+def test_tree_static_completion(counts):
     """Test that tree static example completes successfully."""
-
-    main.main(["main.py", "examples/tree_static/actor_root_tree.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    assert "[System] Cleanup complete!" in captured.out
+    assert counts[b"[System] Cleanup complete!"] >= 1
 
 
-def test_tree_static_all_finish(capsys):
+def test_tree_static_all_finish(counts):
     """Test that all actors finish successfully."""
-
-    main.main(["main.py", "examples/tree_static/actor_root_tree.pya"], timeout=10)
-
-    captured = capsys.readouterr()
-    output = captured.out
-
-    assert "actor_root_tree.pya) finished" in output
-    assert output.count("actor_branch.pya) finished") == 2
-    assert output.count("actor_leaf.pya) finished") == 4
+    assert counts[b"actor_root_tree.pya) finished"] >= 1
+    assert counts[b"actor_branch.pya) finished"] == 2
+    assert counts[b"actor_leaf.pya) finished"] == 4
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])